@@ -1,11 +1,13 @@
 """Example user service demonstrating Pygon style with both legacy and rich error handling."""
 
-from dataclasses import dataclass
+from src.models.user import User
+from src.repositories.user_repository import UserRepository, normalize_email
 from src.types.result_types import (
     Result, ValidationResult, MultipleErrorResult,
     LegacyResult, LegacyValidationResult, LegacyMultipleErrorResult,
     PygonError, create_validation_error, create_not_found_error
 )
+from src.utils.id_generator import next_id
 
 # Domain-specific type aliases using rich errors
 UserResult = Result[User]
@@ -14,12 +16,6 @@ UsersResult = Result[list[User]]
 # Legacy type aliases for backward compatibility examples
 LegacyUserResult = LegacyResult[User]
 
-@dataclass(frozen=True)
-class User:
-    id: int
-    name: str
-    email: str
-
 def validate_email(email: str, field_name: str = "email") -> ValidationResult:
     """Validate email format - single error pattern with rich errors.
     
@@ -180,13 +176,19 @@ def validate_user_data_legacy(name: str, email: str) -> LegacyMultipleErrorResul
     
     return len(errors) == 0, errors
 
-def create_user(name: str, email: str, context: str = "api_registration") -> UserResult:
+def create_user(
+    name: str,
+    email: str,
+    context: str = "api_registration",
+    repository: UserRepository | None = None
+) -> UserResult:
     """Create a new user with rich error validation.
     
     Args:
         name: User name.
         email: User email address.
         context: Context where user creation is happening.
+        repository: Optional repository that assigns the id and enforces unique emails.
         
     Returns:
         A tuple of (created user, PygonError if any).
@@ -212,11 +214,14 @@ def create_user(name: str, email: str, context: str = "api_registration") -> Use
         )
         return None, error
     
+    if repository is not None:
+        return repository.insert(name, email)
+    
     # Create user (in real implementation, this would save to database)
     user = User(
-        id=1,  # In real app, this would be generated
+        id=next_id(),
         name=name.strip(),
-        email=email.lower()
+        email=normalize_email(email)
     )
     
     return user, None
@@ -238,20 +243,26 @@ def create_user_legacy(name: str, email: str) -> LegacyUserResult:
     
     # Create user (in real implementation, this would save to database)
     user = User(
-        id=1,  # In real app, this would be generated
+        id=next_id(),
         name=name.strip(),
-        email=email.lower()
+        email=normalize_email(email)
     )
     
     return user, None
 
-def find_user_by_email(users: list[User], email: str, search_context: str = "user_lookup") -> UserResult:
+def find_user_by_email(
+    users: list[User],
+    email: str,
+    search_context: str = "user_lookup",
+    repository: UserRepository | None = None
+) -> UserResult:
     """Find user by email address with rich error information.
     
     Args:
-        users: List of User objects to search.
+        users: List of User objects to search (ignored when a repository is given).
         email: Email address to search for.
         search_context: Context of the search operation.
+        repository: Optional repository to search through its unique email index instead of users.
         
     Returns:
         A tuple of (User object if found, PygonError if any).
@@ -261,8 +272,11 @@ def find_user_by_email(users: list[User], email: str, search_context: str = "use
     if validation_error:
         return None, validation_error
     
+    if repository is not None:
+        return repository.find_by_email(email, search_context)
+    
     # Search for user
-    normalized_email = email.lower()
+    normalized_email = normalize_email(email)
     for user in users:
         if user.email == normalized_email:
             return user, None
@@ -278,7 +292,6 @@ def find_user_by_email(users: list[User], email: str, search_context: str = "use
             "total_users_searched": len(users)
         },
         metadata={
-            "available_emails": [user.email for user in users],
             "search_method": "email_lookup",
             "case_sensitive": False
         }
@@ -302,7 +315,7 @@ def find_user_by_email_legacy(users: list[User], email: str) -> LegacyUserResult
         return None, validation_error
     
     # Search for user
-    normalized_email = email.lower()
+    normalized_email = normalize_email(email)
     for user in users:
         if user.email == normalized_email:
             return user, None
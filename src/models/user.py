@@ -0,0 +1,10 @@
+"""User domain entity."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class User:
+    id: int
+    name: str
+    email: str
@@ -0,0 +1,271 @@
+"""In-memory user repository with compact storage and secondary indexes.
+
+Users are stored column-wise: ids live in a typed ``array`` and names/emails in
+parallel lists indexed by slot, so a stored user costs a few pointers instead of
+a full ``User`` instance. ``User`` objects are only materialized on reads.
+
+Secondary indexes:
+- unique email index: normalized email -> slot (O(1) duplicate check on insert)
+- name prefix index: log-structured sorted runs of slots ordered by casefolded
+  name. Each insert goes into a small sorted tail run; once the tail is full,
+  runs of equal or smaller size are merged (binary-counter style), so a slot
+  is re-sorted O(log n) times overall and there are O(log n) runs. Searches bisect every run and merge
+  the candidates; they never rebuild the index.
+"""
+
+import itertools
+import threading
+import tracemalloc
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.models.user import User
+from src.types.result_types import (
+    Result,
+    create_not_found_error,
+    create_validation_error,
+)
+from src.utils.id_generator import next_id
+
+UserResult = Result[User]
+UsersResult = Result[list[User]]
+
+# Size of the insort-maintained tail run before it joins the merged runs
+NAME_TAIL_RUN_SIZE = 64
+
+
+@dataclass(frozen=True)
+class UserMemoryReport:
+    user_count: int
+    repository_bytes: int
+    dataclass_bytes: int
+    repository_bytes_per_user: float
+    dataclass_bytes_per_user: float
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for index lookups.
+
+    Args:
+        email: Email address as provided by the caller.
+
+    Returns:
+        Stripped, lower-cased email address.
+    """
+    return email.strip().lower()
+
+
+class UserRepository:
+    """Slot-backed user store with a unique email index and a name prefix index."""
+
+    def __init__(self, id_factory: Callable[[], int] = next_id):
+        """Create an empty repository.
+
+        Args:
+            id_factory: Id source called once per stored user (sortable 64-bit ids by default).
+        """
+        self._lock = threading.Lock()
+        self._next_id = id_factory
+        self._ids = array("q")
+        self._names: list[str] = []
+        self._emails: list[str] = []
+        self._email_index: dict[str, int] = {}
+        self._name_runs: list[array] = []
+
+    def count(self) -> int:
+        """Return the number of stored users."""
+        return len(self._ids)
+
+    def insert(self, name: str, email: str) -> UserResult:
+        """Store a new user, enforcing the unique email constraint.
+
+        Args:
+            name: User name (already validated by the caller).
+            email: User email address (already validated by the caller).
+
+        Returns:
+            A tuple of (created user, PygonError if the email is already registered).
+        """
+        stored_name = name.strip()
+        normalized_email = normalize_email(email)
+
+        with self._lock:
+            existing_slot = self._email_index.get(normalized_email)
+            if existing_slot is not None:
+                error = create_validation_error(
+                    message="email is already registered",
+                    context={
+                        "operation": "user_repository_insert",
+                        "provided_email": email,
+                        "normalized_email": normalized_email,
+                        "validation_step": "unique_check"
+                    },
+                    metadata={
+                        "validation_rule": "unique_email",
+                        "existing_user_id": self._ids[existing_slot],
+                        "stored_user_count": len(self._ids)
+                    }
+                )
+                return None, error
+
+            user_id = self._next_id()
+            slot = len(self._ids)
+            self._ids.append(user_id)
+            self._names.append(stored_name)
+            self._emails.append(normalized_email)
+            self._email_index[normalized_email] = slot
+            self._add_name_run(slot)
+
+        return User(id=user_id, name=stored_name, email=normalized_email), None
+
+    def find_by_email(self, email: str, search_context: str = "user_lookup") -> UserResult:
+        """Find a user through the unique email index.
+
+        Args:
+            email: Email address to search for.
+            search_context: Context of the search operation.
+
+        Returns:
+            A tuple of (User object if found, PygonError if any).
+        """
+        normalized_email = normalize_email(email)
+        slot = self._email_index.get(normalized_email)
+        if slot is None:
+            error = create_not_found_error(
+                message="user not found",
+                context={
+                    "operation": "user_repository_find_by_email",
+                    "search_context": search_context,
+                    "searched_email": email,
+                    "normalized_email": normalized_email
+                },
+                metadata={
+                    "search_method": "unique_email_index",
+                    "stored_user_count": len(self._ids)
+                }
+            )
+            return None, error
+
+        return self._user_at(slot), None
+
+    def search_by_name_prefix(self, prefix: str, limit: int = 50) -> UsersResult:
+        """Find users whose name starts with the given prefix (case-insensitive).
+
+        Args:
+            prefix: Name prefix to search for.
+            limit: Maximum number of users to return.
+
+        Returns:
+            A tuple of (matching users ordered by name, PygonError if any).
+        """
+        if limit <= 0:
+            error = create_validation_error(
+                message="limit must be positive",
+                context={
+                    "operation": "user_repository_search_by_name_prefix",
+                    "provided_limit": limit,
+                    "validation_step": "range_check"
+                },
+                metadata={"validation_rule": "positive_integer"}
+            )
+            return None, error
+
+        key = prefix.casefold()
+        with self._lock:
+            candidates = []
+            for run in self._name_runs:
+                start = bisect_left(run, key, key=self._name_key)
+                for index in range(start, min(start + limit, len(run))):
+                    slot = run[index]
+                    slot_key = self._name_key(slot)
+                    if not slot_key.startswith(key):
+                        break
+                    candidates.append((slot_key, slot))
+
+            candidates.sort()
+            users = [self._user_at(slot) for _, slot in candidates[:limit]]
+
+        return users, None
+
+    def _user_at(self, slot: int) -> User:
+        return User(id=self._ids[slot], name=self._names[slot], email=self._emails[slot])
+
+    def _name_key(self, slot: int) -> str:
+        return self._names[slot].casefold()
+
+    def _add_name_run(self, slot: int) -> None:
+        """Add a slot to the name index (caller holds the lock).
+
+        Full runs are kept in strictly decreasing size; merging two sorted runs
+        with sorted() lets timsort do a linear merge in C.
+        """
+        runs = self._name_runs
+        if not runs or len(runs[-1]) >= NAME_TAIL_RUN_SIZE:
+            runs.append(array("q"))
+        insort(runs[-1], slot, key=self._name_key)
+        if len(runs[-1]) < NAME_TAIL_RUN_SIZE:
+            return
+        while len(runs) > 1 and len(runs[-2]) <= len(runs[-1]):
+            newer = runs.pop()
+            older = runs.pop()
+            runs.append(array("q", sorted(itertools.chain(older, newer), key=self._name_key)))
+
+
+def measure_user_memory(user_count: int) -> Result[UserMemoryReport]:
+    """Compare repository memory use against a plain list of frozen ``User`` dataclasses.
+
+    Intended for sizing runs at the 1M-10M scale; both sides allocate the same
+    synthetic names and emails so the difference is the per-record overhead.
+    Repository bytes include both secondary indexes; the dataclass side has none.
+
+    Args:
+        user_count: Number of synthetic users to store on each side.
+
+    Returns:
+        A tuple of (UserMemoryReport, PygonError if any).
+    """
+    if user_count <= 0:
+        error = create_validation_error(
+            message="user_count must be positive",
+            context={
+                "operation": "measure_user_memory",
+                "provided_user_count": user_count,
+                "validation_step": "range_check"
+            },
+            metadata={"validation_rule": "positive_integer"}
+        )
+        return None, error
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        repository = UserRepository()
+        for index in range(user_count):
+            repository.insert(f"user{index}", f"user{index}@example.com")
+        repository_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        del repository
+
+        baseline, _ = tracemalloc.get_traced_memory()
+        users = [
+            User(id=index + 1, name=f"user{index}", email=f"user{index}@example.com")
+            for index in range(user_count)
+        ]
+        dataclass_bytes = tracemalloc.get_traced_memory()[0] - baseline
+        del users
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    report = UserMemoryReport(
+        user_count=user_count,
+        repository_bytes=repository_bytes,
+        dataclass_bytes=dataclass_bytes,
+        repository_bytes_per_user=repository_bytes / user_count,
+        dataclass_bytes_per_user=dataclass_bytes / user_count
+    )
+    return report, None
@@ -6,14 +6,19 @@ explicit and consistent across the entire codebase.
 Now includes rich error support for enhanced debugging capabilities.
 """
 
-import traceback
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import TypeAlias, TypeVar, Any
 
+from src.utils.datetime_utils import coarse_now_iso
+
 # Generic Result type for any value
 T = TypeVar('T')
 
+# Optional observer called with every new PygonError (see src.utils.error_tracking)
+_error_observer: Callable[["PygonError"], None] | None = None
+
 
 @dataclass(frozen=True)
 class PygonError:
@@ -23,7 +28,7 @@ class PygonError:
         error_type: Type/category of the error (e.g., 'validation_error', 'not_found_error')
         message: Human-readable error message
         context: Additional context information about where/how the error occurred
-        timestamp: When the error occurred (ISO format)
+        timestamp: When the error occurred (ISO format, from the coarse cached clock)
         source_location: File and line information where error was created
         metadata: Additional debugging information as key-value pairs
         cause: Optional underlying exception that caused this error
@@ -31,7 +36,7 @@ class PygonError:
     error_type: str
     message: str
     context: dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=coarse_now_iso)
     source_location: str = field(default="")
     metadata: dict[str, Any] = field(default_factory=dict)
     cause: Exception | None = field(default=None)
@@ -39,13 +44,18 @@ class PygonError:
     def __post_init__(self):
         """Automatically capture source location if not provided."""
         if not self.source_location:
-            # Get the calling frame (skip __post_init__ and __init__)
-            frame = traceback.extract_stack()[-3]
+            # Get the calling frame (skip __post_init__, __init__ and the create_* helpers below)
+            frame = sys._getframe(2)
+            while frame.f_back is not None and frame.f_code.co_filename == __file__:
+                frame = frame.f_back
             object.__setattr__(
                 self, 
                 'source_location', 
-                f"{frame.filename}:{frame.lineno}"
+                f"{frame.f_code.co_filename}:{frame.f_lineno}"
             )
+        
+        if _error_observer is not None:
+            _error_observer(self)
     
     def to_string(self) -> str:
         """Convert to simple string format for backward compatibility."""
@@ -76,6 +86,16 @@ class PygonError:
         return self.to_string()
 
 
+def set_error_observer(observer: Callable[[PygonError], None] | None) -> None:
+    """Install (or clear with None) the observer called for every new PygonError.
+    
+    Args:
+        observer: Callable receiving each newly created error, or None to disable.
+    """
+    global _error_observer
+    _error_observer = observer
+
+
 # Result types with rich error support
 Result: TypeAlias = tuple[T | None, PygonError | None]
 ErrorResult: TypeAlias = tuple[bool, PygonError | None]
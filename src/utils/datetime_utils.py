@@ -0,0 +1,92 @@
+"""Time utilities, including a coarse cached clock for hot paths.
+
+``CoarseClock`` caches the current time and its ISO 8601 string for
+``resolution_seconds``. The first read after the cached value has expired
+refreshes it, so code that stamps many objects (e.g. every PygonError) pays one
+monotonic clock read per object instead of a wall clock call and an
+isoformat(), at the cost of timestamps up to one resolution old. No background
+thread is involved, so an idle process does no work and forked children need
+no special handling.
+"""
+
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.types.result_types import ErrorResult
+
+DEFAULT_CLOCK_RESOLUTION_SECONDS = 0.01
+
+
+class CoarseClock:
+    """Wall clock cached at a fixed resolution and refreshed lazily on read."""
+
+    def __init__(self, resolution_seconds: float = DEFAULT_CLOCK_RESOLUTION_SECONDS):
+        self.resolution_seconds = resolution_seconds
+        self._expires_monotonic_ns = 0
+        # (time_ns, iso string) replaced as one tuple so readers never see a mixed pair
+        self._cached: tuple[int, str] = (0, "")
+
+    @property
+    def resolution_seconds(self) -> float:
+        return self._resolution_ns / 1_000_000_000
+
+    @resolution_seconds.setter
+    def resolution_seconds(self, value: float) -> None:
+        self._resolution_ns = int(value * 1_000_000_000)
+
+    def now_ns(self) -> int:
+        """Return the cached time in nanoseconds since the epoch."""
+        return self._read()[0]
+
+    def now_iso(self) -> str:
+        """Return the cached local time in ISO 8601 format (same format as datetime.now().isoformat())."""
+        return self._read()[1]
+
+    def _read(self) -> tuple[int, str]:
+        if time.monotonic_ns() >= self._expires_monotonic_ns:
+            self._refresh()
+        return self._cached
+
+    def _refresh(self) -> None:
+        # Concurrent refreshes are harmless: each stores a complete, current pair
+        now_ns = time.time_ns()
+        self._cached = (now_ns, datetime.fromtimestamp(now_ns / 1_000_000_000).isoformat())
+        self._expires_monotonic_ns = time.monotonic_ns() + self._resolution_ns
+
+
+coarse_clock = CoarseClock()
+
+
+def coarse_now_iso() -> str:
+    """Return the shared coarse clock's current time in ISO 8601 format."""
+    return coarse_clock.now_iso()
+
+
+def configure_coarse_clock(resolution_seconds: float) -> "ErrorResult":
+    """Change the refresh resolution of the shared coarse clock.
+
+    Args:
+        resolution_seconds: Seconds a cached value is reused (takes effect after the current one expires).
+
+    Returns:
+        A tuple of (success, PygonError if any).
+    """
+    if resolution_seconds <= 0:
+        # Deferred: result_types imports this module for PygonError timestamps
+        from src.types.result_types import create_validation_error
+
+        error = create_validation_error(
+            message="resolution_seconds must be positive",
+            context={
+                "operation": "configure_coarse_clock",
+                "provided_value": resolution_seconds,
+                "validation_step": "range_check"
+            },
+            metadata={"validation_rule": "positive_number"}
+        )
+        return False, error
+
+    coarse_clock.resolution_seconds = resolution_seconds
+    return True, None
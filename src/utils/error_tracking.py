@@ -0,0 +1,333 @@
+"""Opt-in memory tracking for PygonError producers.
+
+Each PygonError holds context/metadata dicts and possibly a cause exception whose
+traceback keeps every frame of the failing call stack (and their locals) alive.
+When tracking is enabled, every new error is attributed to its
+(source_location, error_type) producer and its approximate retained size is
+recorded until the error is garbage collected.
+
+Retained bytes are a shallow estimate: the error, its dicts and their direct
+values, the cause chain, the frames listed in each traceback and the callers
+of its outermost frame. CPython links a finished frame to its caller through
+f_back, so an error that outlives its callers keeps their whole stack (and
+locals) alive. Module-level frames are charged for the frame object but not
+for their globals. Errors whose pinned frames exceed the configured threshold are counted
+as pinning a large traceback.
+
+Releases are reported by weakref.finalize callbacks, which can run during any
+garbage collection pass, including one triggered while _lock is held by the
+same thread. The callbacks therefore only append to a deque; the queued
+releases are applied under the lock by the next track_error or snapshot call.
+
+Usage:
+    enable_error_tracking()
+    stop_reporter, error = start_error_tracking_reporter(interval_seconds=30.0, top_n=10)
+    ...
+    print(format_error_tracking_report(get_error_tracking_snapshot(top_n=10)))
+    stop_reporter.set()
+    disable_error_tracking()
+"""
+
+import sys
+import threading
+import weakref
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import FrameType, TracebackType
+from typing import Any
+
+from src.types.result_types import (
+    PygonError,
+    Result,
+    create_validation_error,
+    set_error_observer,
+)
+
+DEFAULT_LARGE_TRACEBACK_BYTES = 64 * 1024
+
+ProducerKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ErrorProducerStats:
+    source_location: str
+    error_type: str
+    live_count: int
+    retained_bytes: int
+    created_count: int
+    large_traceback_count: int
+
+
+@dataclass(frozen=True)
+class TracebackFootprint:
+    frame_count: int
+    frame_bytes: int
+
+
+class _ProducerCounters:
+    """Mutable counters for one producer (guarded by _lock)."""
+
+    __slots__ = ("created_count", "large_traceback_count", "live_count", "retained_bytes")
+
+    def __init__(self):
+        self.live_count = 0
+        self.retained_bytes = 0
+        self.created_count = 0
+        self.large_traceback_count = 0
+
+
+_lock = threading.Lock()
+_producers: dict[ProducerKey, _ProducerCounters] = {}
+_large_traceback_bytes = DEFAULT_LARGE_TRACEBACK_BYTES
+# Bumped by reset_error_tracking so releases of errors tracked before a reset are ignored
+_generation = 0
+# (generation, key, retained_bytes, large_traceback) queued by finalizers; never guarded by _lock
+_pending_releases: deque[tuple[int, ProducerKey, int, bool]] = deque()
+
+
+def _shallow_size(value: Any) -> int:
+    """Size of a value plus the direct items of dicts/lists/tuples/sets."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + sys.getsizeof(item)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += sys.getsizeof(item)
+    return size
+
+
+def measure_traceback_footprint(traceback: TracebackType | None) -> TracebackFootprint:
+    """Estimate the frames a traceback keeps alive.
+
+    Counts each tb_next entry and each caller on the f_back chain of the
+    outermost frame once. Frames whose locals are the module globals are
+    charged for the frame object only.
+
+    Args:
+        traceback: Traceback to inspect (e.g. ``exception.__traceback__``).
+
+    Returns:
+        Number of pinned frames and their approximate size including locals.
+    """
+    if traceback is None:
+        return TracebackFootprint(frame_count=0, frame_bytes=0)
+
+    frames: list[FrameType] = []
+    caller = traceback.tb_frame.f_back
+    while caller is not None:
+        frames.append(caller)
+        caller = caller.f_back
+    while traceback is not None:
+        frames.append(traceback.tb_frame)
+        traceback = traceback.tb_next
+
+    seen: set[int] = set()
+    frame_bytes = 0
+    for frame in frames:
+        if id(frame) in seen:
+            continue
+        seen.add(id(frame))
+        frame_bytes += sys.getsizeof(frame)
+        frame_locals = frame.f_locals
+        if frame_locals is not frame.f_globals:
+            frame_bytes += _shallow_size(frame_locals)
+    return TracebackFootprint(frame_count=len(seen), frame_bytes=frame_bytes)
+
+
+def measure_cause_footprint(cause: BaseException | None) -> TracebackFootprint:
+    """Estimate the frames pinned by an exception and its __cause__/__context__ chain.
+
+    Args:
+        cause: Exception attached to a PygonError.
+
+    Returns:
+        Combined frame count and size over the exception chain.
+    """
+    frame_count = 0
+    frame_bytes = 0
+    seen: set[int] = set()
+    while cause is not None and id(cause) not in seen:
+        seen.add(id(cause))
+        footprint = measure_traceback_footprint(cause.__traceback__)
+        frame_count += footprint.frame_count
+        frame_bytes += footprint.frame_bytes + _shallow_size(cause.args)
+        cause = cause.__cause__ or cause.__context__
+    return TracebackFootprint(frame_count=frame_count, frame_bytes=frame_bytes)
+
+
+def estimate_error_size(error: PygonError) -> tuple[int, TracebackFootprint]:
+    """Estimate the bytes retained by one error.
+
+    Args:
+        error: Error to measure.
+
+    Returns:
+        A tuple of (approximate retained bytes, footprint of the cause's tracebacks).
+    """
+    size = sys.getsizeof(error) + sys.getsizeof(error.__dict__)
+    size += sys.getsizeof(error.error_type) + sys.getsizeof(error.message)
+    size += sys.getsizeof(error.timestamp) + sys.getsizeof(error.source_location)
+    size += _shallow_size(error.context) + _shallow_size(error.metadata)
+    footprint = measure_cause_footprint(error.cause)
+    return size + footprint.frame_bytes, footprint
+
+
+def _release_error(generation: int, key: ProducerKey, retained_bytes: int, large_traceback: bool) -> None:
+    """Finalizer callback: queue the release without taking _lock (may run inside a GC pass)."""
+    _pending_releases.append((generation, key, retained_bytes, large_traceback))
+
+
+def _apply_pending_releases() -> None:
+    """Apply queued releases to the counters (caller holds _lock)."""
+    while True:
+        try:
+            generation, key, retained_bytes, large_traceback = _pending_releases.popleft()
+        except IndexError:
+            return
+        counters = _producers.get(key)
+        if generation != _generation or counters is None:
+            continue
+        counters.live_count -= 1
+        counters.retained_bytes -= retained_bytes
+        if large_traceback:
+            counters.large_traceback_count -= 1
+
+
+def track_error(error: PygonError) -> None:
+    """Record a newly created error; installed as the PygonError observer while tracking is on.
+
+    Args:
+        error: The error that was just created.
+    """
+    retained_bytes, footprint = estimate_error_size(error)
+    large_traceback = footprint.frame_bytes >= _large_traceback_bytes
+    key = (error.source_location, error.error_type)
+
+    with _lock:
+        _apply_pending_releases()
+        counters = _producers.get(key)
+        if counters is None:
+            counters = _producers[key] = _ProducerCounters()
+        counters.live_count += 1
+        counters.retained_bytes += retained_bytes
+        counters.created_count += 1
+        if large_traceback:
+            counters.large_traceback_count += 1
+        generation = _generation
+
+    weakref.finalize(error, _release_error, generation, key, retained_bytes, large_traceback)
+
+
+def enable_error_tracking(large_traceback_bytes: int = DEFAULT_LARGE_TRACEBACK_BYTES) -> None:
+    """Start attributing new PygonErrors to their producers.
+
+    Args:
+        large_traceback_bytes: Pinned-frame size at which an error's cause is flagged.
+    """
+    global _large_traceback_bytes
+    _large_traceback_bytes = large_traceback_bytes
+    set_error_observer(track_error)
+
+
+def disable_error_tracking() -> None:
+    """Stop tracking new errors; counters for already tracked errors keep updating on release."""
+    set_error_observer(None)
+    with _lock:
+        _apply_pending_releases()
+
+
+def reset_error_tracking() -> None:
+    """Drop all collected counters; errors tracked before the reset no longer affect them."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _producers.clear()
+        _pending_releases.clear()
+
+
+def get_error_tracking_snapshot(top_n: int = 10) -> list[ErrorProducerStats]:
+    """Return the producers retaining the most memory.
+
+    Args:
+        top_n: Maximum number of producers to return.
+
+    Returns:
+        Producer statistics ordered by retained bytes, then live count.
+    """
+    with _lock:
+        _apply_pending_releases()
+        stats = [
+            ErrorProducerStats(
+                source_location=source_location,
+                error_type=error_type,
+                live_count=counters.live_count,
+                retained_bytes=counters.retained_bytes,
+                created_count=counters.created_count,
+                large_traceback_count=counters.large_traceback_count
+            )
+            for (source_location, error_type), counters in _producers.items()
+        ]
+    stats.sort(key=lambda item: (item.retained_bytes, item.live_count), reverse=True)
+    return stats[:top_n]
+
+
+def format_error_tracking_report(stats: list[ErrorProducerStats]) -> str:
+    """Format producer statistics as a plain-text table.
+
+    Args:
+        stats: Snapshot from get_error_tracking_snapshot.
+
+    Returns:
+        Report text, one producer per line.
+    """
+    lines = [f"{'retained_bytes':>14} {'live':>8} {'created':>10} {'large_tb':>8}  error_type @ source_location"]
+    for item in stats:
+        lines.append(
+            f"{item.retained_bytes:>14} {item.live_count:>8} {item.created_count:>10} "
+            f"{item.large_traceback_count:>8}  {item.error_type} @ {item.source_location}"
+        )
+    return "\n".join(lines)
+
+
+def _write_to_stderr(report: str) -> None:
+    print(report, file=sys.stderr)
+
+
+def start_error_tracking_reporter(
+    interval_seconds: float,
+    top_n: int = 10,
+    sink: Callable[[str], None] = _write_to_stderr
+) -> Result[threading.Event]:
+    """Periodically send a top-N producer report to a sink from a daemon thread.
+
+    Args:
+        interval_seconds: Seconds between reports.
+        top_n: Number of producers per report.
+        sink: Callable receiving each formatted report (stderr by default).
+
+    Returns:
+        A tuple of (event that stops the reporter when set, PygonError if any).
+    """
+    if interval_seconds <= 0 or top_n <= 0:
+        error = create_validation_error(
+            message="interval_seconds and top_n must be positive",
+            context={
+                "operation": "start_error_tracking_reporter",
+                "provided_interval_seconds": interval_seconds,
+                "provided_top_n": top_n,
+                "validation_step": "range_check"
+            },
+            metadata={"validation_rule": "positive_number"}
+        )
+        return None, error
+
+    stop_event = threading.Event()
+
+    def report_loop() -> None:
+        while not stop_event.wait(interval_seconds):
+            sink(format_error_tracking_report(get_error_tracking_snapshot(top_n)))
+
+    threading.Thread(target=report_loop, name="pygon-error-tracking-reporter", daemon=True).start()
+    return stop_event, None
@@ -0,0 +1,169 @@
+"""Monotonic-sortable 64-bit id generation.
+
+Id layout (63 bits, always a positive signed 64-bit integer):
+
+    | 41 bits: ms since ID_EPOCH_MS | 10 bits: worker id | 12 bits: sequence |
+
+Ids from one generator are strictly increasing. Ids from different generators
+are unique as long as their worker ids differ, and sort by creation time across
+workers to millisecond precision. When the clock goes backwards or the 4096
+sequence values of a millisecond are exhausted, the generator keeps counting on
+its last timestamp (borrowing the next millisecond) instead of sleeping.
+
+Threads share a generator through its lock. Processes must use distinct worker
+ids, and only an explicit assignment guarantees that:
+
+- ``configure_id_worker`` / ``init_pool_worker_id`` give each process its own
+  worker id. The pool initializer draws from a shared counter and raises once
+  more than MAX_WORKER_ID + 1 workers have been initialized (the counter counts
+  initializations, so pools that recycle workers use ids up faster):
+
+      counter = multiprocessing.Value("i", 0)
+      pool = multiprocessing.Pool(8, initializer=init_pool_worker_id, initargs=(counter,))
+
+- Without an assignment, the default generator uses ``pid % 1024`` and
+  re-derives it after fork. This does NOT guarantee cross-process uniqueness:
+  two live processes whose pids are congruent mod 1024 share a worker id and
+  can produce identical ids in the same millisecond.
+"""
+
+import os
+import threading
+import time
+from typing import Any
+
+from src.types.result_types import ErrorResult, create_validation_error
+
+ID_EPOCH_MS = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+WORKER_ID_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+TIMESTAMP_SHIFT = WORKER_ID_BITS + SEQUENCE_BITS
+
+
+class IdGenerator:
+    """Thread-safe generator of timestamp + worker + sequence ids."""
+
+    def __init__(self, worker_id: int):
+        self._lock = threading.Lock()
+        self._worker_bits = (worker_id & MAX_WORKER_ID) << SEQUENCE_BITS
+        self._last_ms = 0
+        self._sequence = 0
+
+    def next_id(self) -> int:
+        """Return the next id."""
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000 - ID_EPOCH_MS
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            elif self._sequence < MAX_SEQUENCE:
+                self._sequence += 1
+            else:
+                self._last_ms += 1
+                self._sequence = 0
+            return (self._last_ms << TIMESTAMP_SHIFT) | self._worker_bits | self._sequence
+
+
+def decompose_id(generated_id: int) -> dict[str, int]:
+    """Split an id into its fields (for debugging and tests).
+
+    Args:
+        generated_id: Id produced by an IdGenerator.
+
+    Returns:
+        Mapping with timestamp_ms (since the Unix epoch), worker_id and sequence.
+    """
+    return {
+        "timestamp_ms": (generated_id >> TIMESTAMP_SHIFT) + ID_EPOCH_MS,
+        "worker_id": (generated_id >> SEQUENCE_BITS) & MAX_WORKER_ID,
+        "sequence": generated_id & MAX_SEQUENCE,
+    }
+
+
+_default_generator = IdGenerator(os.getpid())
+
+
+def next_id() -> int:
+    """Return the next id from the process-wide default generator."""
+    return _default_generator.next_id()
+
+
+def configure_id_worker(worker_id: int) -> ErrorResult:
+    """Replace the default generator with one using an explicit worker id.
+
+    Args:
+        worker_id: Worker id between 0 and MAX_WORKER_ID, unique among live processes.
+
+    Returns:
+        A tuple of (success, PygonError if any).
+    """
+    global _default_generator
+    if not 0 <= worker_id <= MAX_WORKER_ID:
+        error = create_validation_error(
+            message=f"worker_id must be between 0 and {MAX_WORKER_ID}",
+            context={
+                "operation": "configure_id_worker",
+                "provided_value": worker_id,
+                "validation_step": "range_check"
+            },
+            metadata={"validation_rule": "worker_id_range", "worker_id_bits": WORKER_ID_BITS}
+        )
+        return False, error
+
+    _default_generator = IdGenerator(worker_id)
+    return True, None
+
+
+def assign_worker_id_from_counter(counter: Any) -> ErrorResult:
+    """Configure the default generator with the next worker id from a shared counter.
+
+    Args:
+        counter: ``multiprocessing.Value("i", start)`` shared between processes.
+
+    Returns:
+        A tuple of (success, PygonError if the counter is past MAX_WORKER_ID).
+    """
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+
+    if worker_id > MAX_WORKER_ID:
+        error = create_validation_error(
+            message=f"worker ids exhausted: at most {MAX_WORKER_ID + 1} workers can be assigned",
+            context={
+                "operation": "assign_worker_id_from_counter",
+                "provided_value": worker_id,
+                "validation_step": "range_check"
+            },
+            metadata={"validation_rule": "worker_id_range", "worker_id_bits": WORKER_ID_BITS}
+        )
+        return False, error
+
+    return configure_id_worker(worker_id)
+
+
+def init_pool_worker_id(counter: Any) -> None:
+    """Pool initializer assigning each worker process the next worker id from a shared counter.
+
+    Pool initializers cannot return errors, so exhaustion is raised instead of
+    letting the worker fall back to a possibly colliding worker id.
+
+    Args:
+        counter: ``multiprocessing.Value("i", start)`` shared with the pool.
+
+    Raises:
+        RuntimeError: If no worker id is left.
+    """
+    _, error = assign_worker_id_from_counter(counter)
+    if error is not None:
+        raise RuntimeError(error.to_detailed_string())
+
+
+def _reset_after_fork() -> None:
+    global _default_generator
+    _default_generator = IdGenerator(os.getpid())
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
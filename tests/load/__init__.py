@@ -0,0 +1,8 @@
+"""Load generation tools for sizing Pygon services.
+
+Drives service operations at configurable mixes and failure ratios, either in-process or against
+a local HTTP server, and reports throughput, latency percentiles and error-type distributions as JSON.
+
+Modules: load_generator.py (workload runner and local server), id_clock_benchmark.py (id uniqueness and
+timestamp cost across processes). Runs offline on a single machine.
+"""
@@ -0,0 +1,155 @@
+"""Benchmark for the id generator and coarse clock under a multi-process workload.
+
+Each worker process (assigned a worker id through init_pool_worker_id, or left on
+its pid-derived default with --pid-worker-ids) runs several threads that generate
+ids concurrently. The parent checks that every id is unique and that each
+thread saw strictly increasing ids. The same processes time the coarse clock
+against datetime.now().isoformat() and PygonError construction.
+
+Usage:
+    python -m tests.load.id_clock_benchmark --processes 4 --threads 4 --ids-per-thread 50000
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import Any
+
+from src.types.result_types import PygonError
+from src.utils.datetime_utils import coarse_now_iso
+from src.utils.id_generator import init_pool_worker_id, next_id
+
+BenchmarkReport = dict[str, Any]
+
+
+def _generate_ids(count: int, output: list[array], slot: int) -> None:
+    ids = array("q")
+    for _ in range(count):
+        ids.append(next_id())
+    output[slot] = ids
+
+
+def _time_per_call_ns(function: Any, iterations: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def run_process_workload(threads: int, ids_per_thread: int, timing_iterations: int) -> dict[str, Any]:
+    """Generate ids from several threads and time timestamp sources in one process.
+
+    Args:
+        threads: Number of concurrent id-generating threads.
+        ids_per_thread: Ids generated by each thread.
+        timing_iterations: Calls per timed timestamp source.
+
+    Returns:
+        Per-thread id arrays and per-call timings in nanoseconds.
+    """
+    output: list[array] = [array("q") for _ in range(threads)]
+    workers = [
+        threading.Thread(target=_generate_ids, args=(ids_per_thread, output, slot))
+        for slot in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    id_seconds = time.perf_counter() - start
+
+    coarse_now_iso()  # fill the cache before timing
+    return {
+        "thread_ids": output,
+        "id_seconds": id_seconds,
+        "coarse_clock_ns": _time_per_call_ns(coarse_now_iso, timing_iterations),
+        "datetime_now_iso_ns": _time_per_call_ns(lambda: datetime.now().isoformat(), timing_iterations),
+        "pygon_error_ns": _time_per_call_ns(lambda: PygonError("benchmark_error", "benchmark"), timing_iterations),
+    }
+
+
+def run_benchmark(
+    processes: int,
+    threads: int,
+    ids_per_thread: int,
+    timing_iterations: int,
+    pid_worker_ids: bool
+) -> BenchmarkReport:
+    """Run the workload in a process pool and check ids for collisions and ordering.
+
+    Args:
+        processes: Number of worker processes.
+        threads: Threads per process.
+        ids_per_thread: Ids generated by each thread.
+        timing_iterations: Calls per timed timestamp source.
+        pid_worker_ids: Keep pid-derived worker ids instead of assigning them from a counter.
+
+    Returns:
+        JSON-serializable report.
+    """
+    counter = multiprocessing.Value("i", 0)
+    initializer = None if pid_worker_ids else init_pool_worker_id
+    initargs = () if pid_worker_ids else (counter,)
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes, initializer=initializer, initargs=initargs) as pool:
+        results = pool.starmap(
+            run_process_workload,
+            [(threads, ids_per_thread, timing_iterations)] * processes
+        )
+    wall_seconds = time.perf_counter() - start
+
+    all_ids: set[int] = set()
+    total_ids = 0
+    unordered_threads = 0
+    for result in results:
+        for ids in result["thread_ids"]:
+            total_ids += len(ids)
+            all_ids.update(ids)
+            if any(earlier >= later for earlier, later in itertools.pairwise(ids)):
+                unordered_threads += 1
+
+    def mean(key: str) -> float:
+        return sum(result[key] for result in results) / len(results)
+
+    return {
+        "processes": processes,
+        "threads_per_process": threads,
+        "ids_per_thread": ids_per_thread,
+        "worker_ids": "pid" if pid_worker_ids else "pool_counter",
+        "wall_seconds": wall_seconds,
+        "total_ids": total_ids,
+        "duplicate_ids": total_ids - len(all_ids),
+        "threads_with_unordered_ids": unordered_threads,
+        "ids_per_sec_per_process": total_ids / processes / mean("id_seconds"),
+        "coarse_clock_ns_per_call": mean("coarse_clock_ns"),
+        "datetime_now_iso_ns_per_call": mean("datetime_now_iso_ns"),
+        "pygon_error_ns_per_call": mean("pygon_error_ns"),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark id generation and the coarse clock.")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--ids-per-thread", type=int, default=50_000)
+    parser.add_argument("--timing-iterations", type=int, default=100_000)
+    parser.add_argument("--pid-worker-ids", action="store_true",
+                        help="use pid-derived worker ids instead of a shared counter")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        args.processes, args.threads, args.ids_per_thread, args.timing_iterations, args.pid_worker_ids
+    )
+    print(json.dumps(report, indent=2))
+    return 1 if report["duplicate_ids"] or report["threads_with_unordered_ids"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,585 @@
+"""Load generator driving Pygon service operations at configurable mixes.
+
+Runs entirely offline on one machine, either calling the services in-process or
+sending JSON requests to a local HTTP server wrapping the same operations.
+
+Usage:
+    # In-process, closed loop, 4 worker processes
+    python -m tests.load.load_generator --mix create_user=0.2,find_user_by_email=0.8 \\
+        --failure-ratio 0.1 --workers 4 --duration 10
+
+    # Open loop at 2000 ops/s against a server started by the generator itself
+    python -m tests.load.load_generator --target http --spawn-server \\
+        --arrival open --rate 2000 --workers 4
+
+    # Standalone server for runs from another terminal
+    python -m tests.load.load_generator --serve --port 8765
+
+Arrival models:
+- closed: each worker issues its next request when the previous one completes
+  (plus optional think time); throughput is an output of the run.
+- open: each worker follows a Poisson schedule at rate / workers. Latency is
+  measured from the scheduled start, so time spent queued behind a slow request
+  is included instead of being silently omitted.
+
+The report is a JSON document with overall and per-operation throughput,
+latency percentiles in milliseconds and error-type distributions.
+"""
+
+import argparse
+import dataclasses
+import http.client
+import itertools
+import json
+import math
+import multiprocessing
+import random
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.examples.user_service import create_user, find_user_by_email
+from src.repositories.user_repository import UserRepository
+from src.types.result_types import Result, ValidationResult, create_validation_error
+
+ARRIVAL_MODELS = ("closed", "open")
+TARGETS = ("inprocess", "http")
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+TRANSPORT_ERROR = "transport_error"
+
+# Executes one operation and returns the resulting error_type, or None on success
+OperationExecutor = Callable[[str, dict[str, str]], str | None]
+LoadReport = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    operation_mix: dict[str, float]
+    failure_ratio: float = 0.0
+    arrival_model: str = "closed"
+    target: str = "inprocess"
+    base_url: str = "http://127.0.0.1:8765"
+    workers: int = 1
+    duration_seconds: float = 10.0
+    target_rate: float = 100.0
+    think_time_seconds: float = 0.0
+    user_pool_size: int = 1000
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    operation: str
+    arguments: dict[str, str]
+    injected_failure: bool
+
+
+@dataclass(frozen=True)
+class WorkerStats:
+    worker_index: int
+    elapsed_seconds: float
+    latencies: dict[str, array] = field(default_factory=dict)
+    error_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    injected_failures: dict[str, int] = field(default_factory=dict)
+
+
+class WorkloadState:
+    """Service state shared by the operations of one process: a seeded repository."""
+
+    def __init__(self, user_pool_size: int):
+        self.repository = UserRepository()
+        for index in range(user_pool_size):
+            self.repository.insert(f"seed{index}", seed_email(index))
+
+
+def seed_email(index: int) -> str:
+    """Return the email of the index-th pre-seeded user (identical in every process)."""
+    return f"seed{index}@example.com"
+
+
+def _run_create_user(state: WorkloadState, arguments: dict[str, str]) -> str | None:
+    _, error = create_user(
+        arguments.get("name", ""),
+        arguments.get("email", ""),
+        "load_test",
+        repository=state.repository
+    )
+    return error.error_type if error else None
+
+
+def _run_find_user_by_email(state: WorkloadState, arguments: dict[str, str]) -> str | None:
+    _, error = find_user_by_email([], arguments.get("email", ""), "load_test", repository=state.repository)
+    return error.error_type if error else None
+
+
+# Operation name -> handler; add entries here to include new services in the mix
+OPERATION_HANDLERS: dict[str, Callable[[WorkloadState, dict[str, str]], str | None]] = {
+    "create_user": _run_create_user,
+    "find_user_by_email": _run_find_user_by_email,
+}
+
+
+def execute_operation(state: WorkloadState, operation: str, arguments: dict[str, str]) -> str | None:
+    """Run one operation in-process.
+
+    Args:
+        state: Service state of the current process.
+        operation: Key of OPERATION_HANDLERS.
+        arguments: Operation arguments.
+
+    Returns:
+        The error_type reported by the service, or None on success.
+    """
+    return OPERATION_HANDLERS[operation](state, arguments)
+
+
+def build_request(
+    rng: random.Random,
+    operations: list[str],
+    weights: list[float],
+    config: LoadConfig,
+    run_tag: str,
+    sequence: int
+) -> LoadRequest:
+    """Draw the next request from the configured mix.
+
+    Injected failures alternate between malformed input (validation_error) and
+    conflicting or unknown records (duplicate email, not_found_error).
+
+    Args:
+        rng: Per-worker random generator.
+        operations: Operation names of the mix.
+        weights: Relative weights matching operations.
+        config: Load configuration.
+        run_tag: Tag unique to this worker and run, used for fresh emails.
+        sequence: Per-worker request sequence number.
+
+    Returns:
+        The request to execute.
+    """
+    operation = rng.choices(operations, weights)[0]
+    injected_failure = rng.random() < config.failure_ratio
+    malformed = rng.random() < 0.5
+    fresh_email = f"load-{run_tag}-{sequence}@example.com"
+
+    if operation == "create_user":
+        if not injected_failure:
+            email = fresh_email
+        elif malformed:
+            email = fresh_email.replace("@", "-at-")
+        else:
+            email = seed_email(rng.randrange(config.user_pool_size))
+        arguments = {"name": f"load-{run_tag}-{sequence}", "email": email}
+    else:
+        if not injected_failure:
+            email = seed_email(rng.randrange(config.user_pool_size))
+        elif malformed:
+            email = fresh_email.replace("@", "-at-")
+        else:
+            email = fresh_email
+        arguments = {"email": email}
+
+    return LoadRequest(operation=operation, arguments=arguments, injected_failure=injected_failure)
+
+
+def create_inprocess_executor(user_pool_size: int) -> OperationExecutor:
+    """Create an executor that calls the services directly on freshly seeded state.
+
+    Args:
+        user_pool_size: Number of pre-seeded users.
+
+    Returns:
+        Executor returning the service-reported error_type.
+    """
+    state = WorkloadState(user_pool_size)
+
+    def execute(operation: str, arguments: dict[str, str]) -> str | None:
+        return execute_operation(state, operation, arguments)
+
+    return execute
+
+
+def create_http_executor(base_url: str) -> OperationExecutor:
+    """Create an executor that posts operations to a load server over one keep-alive connection.
+
+    Args:
+        base_url: Server URL, e.g. http://127.0.0.1:8765.
+
+    Returns:
+        Executor returning the server-reported error_type, or TRANSPORT_ERROR.
+    """
+    parts = urlsplit(base_url)
+    connection = http.client.HTTPConnection(parts.hostname or "127.0.0.1", parts.port or 80, timeout=30)
+    headers = {"Content-Type": "application/json"}
+
+    def execute(operation: str, arguments: dict[str, str]) -> str | None:
+        try:
+            connection.request("POST", f"/{operation}", json.dumps(arguments).encode("utf-8"), headers)
+            response = connection.getresponse()
+            payload = json.loads(response.read())
+        except (OSError, http.client.HTTPException, ValueError):
+            connection.close()
+            return TRANSPORT_ERROR
+        if response.status != 200:
+            return payload.get("error_type", TRANSPORT_ERROR)
+        return payload.get("error_type")
+
+    return execute
+
+
+def create_load_server(host: str, port: int, user_pool_size: int) -> ThreadingHTTPServer:
+    """Create a local HTTP server exposing OPERATION_HANDLERS as POST /<operation>.
+
+    Service errors are returned as 200 responses carrying their error_type, matching
+    the in-process executor; malformed requests get 400 with bad_request_error.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind (0 picks a free port).
+        user_pool_size: Number of pre-seeded users.
+
+    Returns:
+        The (not yet serving) server.
+    """
+    state = WorkloadState(user_pool_size)
+
+    class LoadRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self) -> None:
+            operation = self.path.lstrip("/")
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                arguments = json.loads(self.rfile.read(length))
+            except ValueError:
+                arguments = None
+
+            if operation not in OPERATION_HANDLERS or not isinstance(arguments, dict):
+                status, payload = 400, {"error_type": "bad_request_error"}
+            else:
+                status, payload = 200, {"error_type": execute_operation(state, operation, arguments)}
+
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return ThreadingHTTPServer((host, port), LoadRequestHandler)
+
+
+def run_worker(config: LoadConfig, worker_index: int, run_tag: str) -> WorkerStats:
+    """Drive load from one worker process until the configured duration elapses.
+
+    Args:
+        config: Validated load configuration.
+        worker_index: Index of this worker.
+        run_tag: Tag unique to this run.
+
+    Returns:
+        Raw latencies and error counts collected by the worker.
+    """
+    rng = random.Random(config.seed * 1_000_003 + worker_index)
+    operations = list(config.operation_mix)
+    weights = [config.operation_mix[operation] for operation in operations]
+    worker_tag = f"{run_tag}-{worker_index}"
+
+    if config.target == "http":
+        executor = create_http_executor(config.base_url)
+    else:
+        executor = create_inprocess_executor(config.user_pool_size)
+
+    latencies = {operation: array("d") for operation in operations}
+    error_counts = {operation: Counter() for operation in operations}
+    injected_failures = Counter()
+    open_loop = config.arrival_model == "open"
+    worker_rate = config.target_rate / config.workers
+
+    start = time.perf_counter()
+    deadline = start + config.duration_seconds
+    next_start = start
+    for sequence in itertools.count():
+        if open_loop:
+            next_start += rng.expovariate(worker_rate)
+            if next_start >= deadline:
+                break
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            scheduled = next_start
+        else:
+            scheduled = time.perf_counter()
+            if scheduled >= deadline:
+                break
+
+        request = build_request(rng, operations, weights, config, worker_tag, sequence)
+        error_type = executor(request.operation, request.arguments)
+        latencies[request.operation].append(time.perf_counter() - scheduled)
+        if error_type is not None:
+            error_counts[request.operation][error_type] += 1
+        if request.injected_failure:
+            injected_failures[request.operation] += 1
+
+        if not open_loop and config.think_time_seconds > 0:
+            time.sleep(config.think_time_seconds)
+
+    return WorkerStats(
+        worker_index=worker_index,
+        elapsed_seconds=time.perf_counter() - start,
+        latencies=latencies,
+        error_counts={operation: dict(counts) for operation, counts in error_counts.items()},
+        injected_failures=dict(injected_failures)
+    )
+
+
+def summarize_latencies(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples (seconds) as nearest-rank percentiles in milliseconds.
+
+    Args:
+        samples: Latency samples sorted ascending.
+
+    Returns:
+        Mapping of p50/p90/p99/p99.9/max/mean to milliseconds (empty if no samples).
+    """
+    if not samples:
+        return {}
+    summary = {}
+    for percentile in PERCENTILES:
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        summary[f"p{percentile:g}"] = samples[rank - 1] * 1000
+    summary["max"] = samples[-1] * 1000
+    summary["mean"] = sum(samples) / len(samples) * 1000
+    return summary
+
+
+def build_report(config: LoadConfig, worker_stats: list[WorkerStats], wall_seconds: float) -> LoadReport:
+    """Merge worker statistics into the JSON-serializable load report.
+
+    Args:
+        config: Load configuration used for the run.
+        worker_stats: Statistics returned by every worker.
+        wall_seconds: Wall-clock duration of the run.
+
+    Returns:
+        Report dictionary.
+    """
+    operations_report = {}
+    total_errors = Counter()
+    total_operations = 0
+    for operation in config.operation_mix:
+        samples = sorted(itertools.chain.from_iterable(stats.latencies[operation] for stats in worker_stats))
+        errors = Counter()
+        injected = 0
+        for stats in worker_stats:
+            errors.update(stats.error_counts[operation])
+            injected += stats.injected_failures.get(operation, 0)
+        total_errors.update(errors)
+        total_operations += len(samples)
+        operations_report[operation] = {
+            "count": len(samples),
+            "throughput_ops_per_sec": len(samples) / wall_seconds,
+            "error_count": sum(errors.values()),
+            "injected_failures": injected,
+            "error_types": dict(errors),
+            "latency_ms": summarize_latencies(samples)
+        }
+
+    return {
+        "config": dataclasses.asdict(config),
+        "wall_seconds": wall_seconds,
+        "total_operations": total_operations,
+        "throughput_ops_per_sec": total_operations / wall_seconds,
+        "error_count": sum(total_errors.values()),
+        "error_types": dict(total_errors),
+        "operations": operations_report
+    }
+
+
+def validate_load_config(config: LoadConfig) -> ValidationResult:
+    """Validate a load configuration - single error pattern.
+
+    Args:
+        config: Load configuration to validate.
+
+    Returns:
+        A tuple of (validation result, PygonError if any).
+    """
+    checks = [
+        (bool(config.operation_mix), "operation mix is required", "operation_mix"),
+        (all(operation in OPERATION_HANDLERS for operation in config.operation_mix),
+         f"unknown operation in mix (known: {', '.join(OPERATION_HANDLERS)})", "operation_mix"),
+        (all(weight >= 0 for weight in config.operation_mix.values())
+         and sum(config.operation_mix.values()) > 0,
+         "operation weights must be non-negative with a positive sum", "operation_mix"),
+        (0.0 <= config.failure_ratio <= 1.0, "failure_ratio must be between 0 and 1", "failure_ratio"),
+        (config.arrival_model in ARRIVAL_MODELS, f"arrival_model must be one of {ARRIVAL_MODELS}", "arrival_model"),
+        (config.target in TARGETS, f"target must be one of {TARGETS}", "target"),
+        (config.workers >= 1, "workers must be at least 1", "workers"),
+        (config.duration_seconds > 0, "duration_seconds must be positive", "duration_seconds"),
+        (config.target_rate > 0, "target_rate must be positive", "target_rate"),
+        (config.think_time_seconds >= 0, "think_time_seconds must not be negative", "think_time_seconds"),
+        (config.user_pool_size >= 1, "user_pool_size must be at least 1", "user_pool_size"),
+    ]
+    for passed, message, field_name in checks:
+        if not passed:
+            error = create_validation_error(
+                message=message,
+                context={
+                    "field_name": field_name,
+                    "provided_value": getattr(config, field_name),
+                    "validation_step": "load_config_check"
+                },
+                metadata={"operation": "validate_load_config"}
+            )
+            return False, error
+    return True, None
+
+
+def run_load(config: LoadConfig) -> Result[LoadReport]:
+    """Run a load test and build its report.
+
+    Args:
+        config: Load configuration.
+
+    Returns:
+        A tuple of (report, PygonError if the configuration is invalid).
+    """
+    is_valid, error = validate_load_config(config)
+    if not is_valid:
+        return None, error
+
+    run_tag = format(time.time_ns(), "x")
+    start = time.perf_counter()
+    if config.workers == 1:
+        worker_stats = [run_worker(config, 0, run_tag)]
+    else:
+        with multiprocessing.Pool(config.workers) as pool:
+            worker_stats = pool.starmap(
+                run_worker,
+                [(config, worker_index, run_tag) for worker_index in range(config.workers)]
+            )
+    wall_seconds = time.perf_counter() - start
+
+    return build_report(config, worker_stats, wall_seconds), None
+
+
+def parse_operation_mix(text: str) -> Result[dict[str, float]]:
+    """Parse an operation mix such as ``create_user=0.2,find_user_by_email=0.8``.
+
+    Args:
+        text: Comma-separated operation=weight pairs.
+
+    Returns:
+        A tuple of (operation -> weight, PygonError if any).
+    """
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        operation, _, weight = item.partition("=")
+        try:
+            mix[operation.strip()] = float(weight)
+        except ValueError:
+            error = create_validation_error(
+                message="invalid operation weight",
+                context={"field_name": "mix", "provided_value": item, "validation_step": "format_check"},
+                metadata={"expected_format": "operation=weight[,operation=weight...]"}
+            )
+            return None, error
+    return mix, None
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate load against Pygon service operations.")
+    parser.add_argument("--mix", default="create_user=0.2,find_user_by_email=0.8",
+                        help="comma-separated operation=weight pairs")
+    parser.add_argument("--failure-ratio", type=float, default=0.0,
+                        help="fraction of requests built to fail (0-1)")
+    parser.add_argument("--arrival", choices=ARRIVAL_MODELS, default="closed")
+    parser.add_argument("--rate", type=float, default=100.0, help="total open-loop arrival rate (ops/s)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="closed-loop pause between requests (s)")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--duration", type=float, default=10.0, help="run duration (s)")
+    parser.add_argument("--user-pool-size", type=int, default=1000, help="pre-seeded users per service")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target", choices=TARGETS, default="inprocess")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8765")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="with --target http, start a local server for the run")
+    parser.add_argument("--serve", action="store_true", help="only run the local load server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_argument_parser().parse_args(argv)
+
+    if args.serve:
+        server = create_load_server(args.host, args.port, args.user_pool_size)
+        print(f"serving on http://{args.host}:{server.server_address[1]}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+
+    mix, error = parse_operation_mix(args.mix)
+    if error:
+        print(f"Error: {error.to_string()}", file=sys.stderr)
+        return 1
+
+    config = LoadConfig(
+        operation_mix=mix,
+        failure_ratio=args.failure_ratio,
+        arrival_model=args.arrival,
+        target=args.target,
+        base_url=args.base_url,
+        workers=args.workers,
+        duration_seconds=args.duration,
+        target_rate=args.rate,
+        think_time_seconds=args.think_time,
+        user_pool_size=args.user_pool_size,
+        seed=args.seed
+    )
+
+    server = None
+    if args.target == "http" and args.spawn_server:
+        server = create_load_server(args.host, 0, args.user_pool_size)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = dataclasses.replace(config, base_url=f"http://{args.host}:{server.server_address[1]}")
+
+    try:
+        report, error = run_load(config)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    if error:
+        print(f"Error: {error.to_string()}", file=sys.stderr)
+        return 1
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
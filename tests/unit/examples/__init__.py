@@ -0,0 +1 @@
+"""Unit tests for the reference implementations (src/examples)."""
@@ -0,0 +1,108 @@
+"""Unit tests for src/examples/user_service.py."""
+
+from src.examples.user_service import (
+    create_user,
+    create_user_legacy,
+    find_user_by_email,
+)
+from src.repositories.user_repository import UserRepository
+from src.utils.id_generator import decompose_id
+
+
+class TestCreateUserWithRepository:
+    def test_repository_assigns_ids_and_stores_user(self):
+        repository = UserRepository()
+
+        first, first_error = create_user("Alice", "Alice@example.com", repository=repository)
+        second, second_error = create_user("Bob", "bob@example.com", repository=repository)
+
+        assert first_error is None
+        assert second_error is None
+        assert first.id != second.id
+        assert first.email == "alice@example.com"
+        assert repository.find_by_email("alice@example.com")[0] == first
+
+    def test_duplicate_email_returns_validation_error(self):
+        repository = UserRepository()
+        create_user("Alice", "alice@example.com", repository=repository)
+
+        user, error = create_user("Alice", "ALICE@example.com", repository=repository)
+
+        assert user is None
+        assert error.error_type == "validation_error"
+        assert error.metadata["validation_rule"] == "unique_email"
+
+    def test_invalid_input_is_not_stored(self):
+        repository = UserRepository()
+
+        user, error = create_user("", "not-an-email", repository=repository)
+
+        assert user is None
+        assert error.error_type == "validation_error"
+        assert repository.count() == 0
+
+
+class TestCreateUserWithoutRepository:
+    def test_ids_come_from_id_generator(self):
+        first, first_error = create_user("Alice", "alice@example.com")
+        second, second_error = create_user("Bob", "bob@example.com")
+
+        assert first_error is None
+        assert second_error is None
+        assert second.id > first.id > 1
+        assert decompose_id(first.id)["timestamp_ms"] <= decompose_id(second.id)["timestamp_ms"]
+
+    def test_email_is_normalized_like_the_repository(self):
+        repository = UserRepository()
+
+        user, _ = create_user("Alice", " Alice@Example.com ")
+        legacy_user, _ = create_user_legacy("Alice", " Alice@Example.com ")
+        stored_user, _ = create_user("Alice", " Alice@Example.com ", repository=repository)
+
+        assert user.email == legacy_user.email == stored_user.email == "alice@example.com"
+
+
+class TestFindUserByEmail:
+    def test_repository_lookup_uses_email_index(self):
+        repository = UserRepository()
+        created, _ = create_user("Alice", "alice@example.com", repository=repository)
+
+        user, error = find_user_by_email([], " ALICE@example.com", repository=repository)
+
+        assert error is None
+        assert user == created
+
+    def test_repository_miss_returns_not_found_error(self):
+        repository = UserRepository()
+        create_user("Alice", "alice@example.com", repository=repository)
+
+        user, error = find_user_by_email([], "bob@example.com", "admin_search", repository=repository)
+
+        assert user is None
+        assert error.error_type == "not_found_error"
+        assert error.context["search_context"] == "admin_search"
+        assert error.metadata["search_method"] == "unique_email_index"
+
+    def test_invalid_email_is_rejected_before_repository_lookup(self):
+        user, error = find_user_by_email([], "not-an-email", repository=UserRepository())
+
+        assert user is None
+        assert error.error_type == "validation_error"
+
+    def test_list_lookup_normalizes_email(self):
+        created, _ = create_user("Alice", "alice@example.com")
+
+        user, error = find_user_by_email([created], " Alice@Example.com ")
+
+        assert error is None
+        assert user == created
+
+    def test_list_miss_does_not_list_stored_emails(self):
+        created, _ = create_user("Alice", "alice@example.com")
+
+        user, error = find_user_by_email([created], "bob@example.com")
+
+        assert user is None
+        assert error.error_type == "not_found_error"
+        assert error.context["total_users_searched"] == 1
+        assert "available_emails" not in error.metadata
@@ -0,0 +1,209 @@
+"""Unit tests for tests/load/load_generator.py."""
+
+import random
+import threading
+
+import pytest
+
+from tests.load.load_generator import (
+    PERCENTILES,
+    LoadConfig,
+    build_request,
+    create_http_executor,
+    create_load_server,
+    parse_operation_mix,
+    run_load,
+    seed_email,
+    summarize_latencies,
+    validate_load_config,
+)
+
+USER_POOL_SIZE = 20
+MIX = {"create_user": 1.0, "find_user_by_email": 1.0}
+
+
+def create_config(**overrides) -> LoadConfig:
+    values = {
+        "operation_mix": MIX,
+        "duration_seconds": 0.2,
+        "user_pool_size": USER_POOL_SIZE,
+        "seed": 7,
+    }
+    values.update(overrides)
+    return LoadConfig(**values)
+
+
+def draw_requests(config: LoadConfig, count: int) -> list:
+    rng = random.Random(config.seed)
+    operations = list(config.operation_mix)
+    weights = [config.operation_mix[operation] for operation in operations]
+    return [build_request(rng, operations, weights, config, "tag", sequence) for sequence in range(count)]
+
+
+@pytest.fixture
+def load_server():
+    server = create_load_server(host="127.0.0.1", port=0, user_pool_size=USER_POOL_SIZE)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestSummarizeLatencies:
+    def test_no_samples_returns_empty_summary(self):
+        assert summarize_latencies([]) == {}
+
+    def test_single_sample_is_every_percentile(self):
+        summary = summarize_latencies([0.002])
+
+        assert summary == {"p50": 2.0, "p90": 2.0, "p99": 2.0, "p99.9": 2.0, "max": 2.0, "mean": 2.0}
+
+    def test_nearest_rank_percentiles(self):
+        samples = [index / 1000 for index in range(1, 11)]
+
+        summary = summarize_latencies(samples)
+
+        assert summary["p50"] == pytest.approx(5.0)
+        assert summary["p90"] == pytest.approx(9.0)
+        assert summary["p99"] == pytest.approx(10.0)
+        assert summary["mean"] == pytest.approx(5.5)
+
+    def test_p99_9_on_small_sample_is_the_maximum(self):
+        samples = [index / 1000 for index in range(1, 101)]
+
+        summary = summarize_latencies(samples)
+
+        assert summary["p99"] == pytest.approx(99.0)
+        assert summary["p99.9"] == pytest.approx(100.0)
+        assert summary["max"] == pytest.approx(100.0)
+
+
+class TestBuildRequest:
+    def test_requests_without_injected_failures_are_valid(self):
+        requests = draw_requests(create_config(failure_ratio=0.0), 200)
+        seed_emails = {seed_email(index) for index in range(USER_POOL_SIZE)}
+
+        for request in requests:
+            assert not request.injected_failure
+            if request.operation == "create_user":
+                assert request.arguments["email"].startswith("load-tag-")
+            else:
+                assert request.arguments["email"] in seed_emails
+
+    def test_create_user_failures_are_malformed_or_existing_emails(self):
+        config = create_config(operation_mix={"create_user": 1.0}, failure_ratio=1.0)
+        seed_emails = {seed_email(index) for index in range(USER_POOL_SIZE)}
+
+        emails = [request.arguments["email"] for request in draw_requests(config, 200)]
+
+        malformed = [email for email in emails if "@" not in email]
+        existing = [email for email in emails if email in seed_emails]
+        assert malformed
+        assert existing
+        assert len(malformed) + len(existing) == len(emails)
+
+    def test_find_failures_are_malformed_or_unknown_emails(self):
+        config = create_config(operation_mix={"find_user_by_email": 1.0}, failure_ratio=1.0)
+        seed_emails = {seed_email(index) for index in range(USER_POOL_SIZE)}
+
+        emails = [request.arguments["email"] for request in draw_requests(config, 200)]
+
+        malformed = [email for email in emails if "@" not in email]
+        unknown = [email for email in emails if "@" in email and email not in seed_emails]
+        assert malformed
+        assert unknown
+        assert len(malformed) + len(unknown) == len(emails)
+
+    def test_same_seed_draws_same_requests(self):
+        config = create_config(failure_ratio=0.3)
+
+        assert draw_requests(config, 50) == draw_requests(config, 50)
+
+
+class TestValidateLoadConfig:
+    def test_valid_config_passes(self):
+        assert validate_load_config(create_config()) == (True, None)
+
+    @pytest.mark.parametrize(("overrides", "field_name"), [
+        ({"operation_mix": {}}, "operation_mix"),
+        ({"operation_mix": {"delete_user": 1.0}}, "operation_mix"),
+        ({"operation_mix": {"create_user": 0.0}}, "operation_mix"),
+        ({"operation_mix": {"create_user": -1.0, "find_user_by_email": 2.0}}, "operation_mix"),
+        ({"failure_ratio": 1.5}, "failure_ratio"),
+        ({"arrival_model": "burst"}, "arrival_model"),
+        ({"target": "grpc"}, "target"),
+        ({"workers": 0}, "workers"),
+        ({"duration_seconds": 0}, "duration_seconds"),
+        ({"target_rate": 0}, "target_rate"),
+        ({"think_time_seconds": -0.1}, "think_time_seconds"),
+        ({"user_pool_size": 0}, "user_pool_size"),
+    ])
+    def test_invalid_field_returns_validation_error(self, overrides, field_name):
+        is_valid, error = validate_load_config(create_config(**overrides))
+
+        assert is_valid is False
+        assert error.error_type == "validation_error"
+        assert error.context["field_name"] == field_name
+        assert error.context["validation_step"] == "load_config_check"
+
+
+class TestParseOperationMix:
+    def test_parses_pairs_and_skips_empty_items(self):
+        mix, error = parse_operation_mix(" create_user=0.2, ,find_user_by_email=0.8,")
+
+        assert error is None
+        assert mix == {"create_user": 0.2, "find_user_by_email": 0.8}
+
+    @pytest.mark.parametrize("text", ["create_user", "create_user=abc", "create_user=0.2,find_user_by_email="])
+    def test_bad_weight_returns_validation_error(self, text):
+        mix, error = parse_operation_mix(text)
+
+        assert mix is None
+        assert error.error_type == "validation_error"
+        assert error.context["validation_step"] == "format_check"
+
+
+class TestRunLoad:
+    def test_invalid_config_returns_error_without_running(self):
+        report, error = run_load(create_config(workers=0))
+
+        assert report is None
+        assert error.error_type == "validation_error"
+
+    @pytest.mark.parametrize("arrival_model", ["closed", "open"])
+    def test_inprocess_run_reports_only_injected_failures(self, arrival_model):
+        config = create_config(failure_ratio=0.5, arrival_model=arrival_model, target_rate=500.0)
+
+        report, error = run_load(config)
+
+        assert error is None
+        assert_consistent_report(report)
+
+    def test_http_run_reports_only_injected_failures(self, load_server):
+        config = create_config(failure_ratio=0.5, target="http", base_url=load_server)
+
+        report, error = run_load(config)
+
+        assert error is None
+        assert report["error_types"].get("transport_error") is None
+        assert_consistent_report(report)
+
+    def test_http_unknown_operation_returns_bad_request_error(self, load_server):
+        execute = create_http_executor(load_server)
+
+        assert execute("delete_user", {}) == "bad_request_error"
+        assert execute("find_user_by_email", {"email": seed_email(0)}) is None
+
+
+def assert_consistent_report(report: dict) -> None:
+    assert report["total_operations"] > 0
+    assert set(report["operations"]) == set(MIX)
+    assert set(report["error_types"]) <= {"validation_error", "not_found_error"}
+    for operation_report in report["operations"].values():
+        # Every injected failure fails and nothing else does
+        assert operation_report["error_count"] == operation_report["injected_failures"]
+        if operation_report["count"]:
+            assert set(operation_report["latency_ms"]) == {f"p{p:g}" for p in PERCENTILES} | {"max", "mean"}
+    assert report["error_count"] == sum(item["error_count"] for item in report["operations"].values())
@@ -0,0 +1 @@
+"""Unit tests for the data access layer (src/repositories)."""
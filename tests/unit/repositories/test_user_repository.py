@@ -0,0 +1,156 @@
+"""Unit tests for src/repositories/user_repository.py."""
+
+import itertools
+
+from src.repositories.user_repository import (
+    NAME_TAIL_RUN_SIZE,
+    UserRepository,
+    measure_user_memory,
+    normalize_email,
+)
+from src.utils.id_generator import decompose_id
+
+
+def create_sequential_repository() -> UserRepository:
+    return UserRepository(id_factory=itertools.count(1).__next__)
+
+
+def create_repository(*names: str) -> UserRepository:
+    repository = create_sequential_repository()
+    for index, name in enumerate(names):
+        repository.insert(name, f"user{index}@example.com")
+    return repository
+
+
+class TestInsert:
+    def test_insert_returns_user_with_ids_from_factory(self):
+        repository = create_sequential_repository()
+
+        first, first_error = repository.insert(" Alice ", "Alice@Example.com")
+        second, second_error = repository.insert("Bob", "bob@example.com")
+
+        assert first_error is None
+        assert second_error is None
+        assert (first.id, first.name, first.email) == (1, "Alice", "alice@example.com")
+        assert second.id == 2
+        assert repository.count() == 2
+
+    def test_default_ids_come_from_id_generator(self):
+        repository = UserRepository()
+
+        first, _ = repository.insert("Alice", "alice@example.com")
+        second, _ = repository.insert("Bob", "bob@example.com")
+
+        assert first.id > 1 << 22
+        assert second.id > first.id
+        assert decompose_id(first.id)["worker_id"] == decompose_id(second.id)["worker_id"]
+
+    def test_duplicate_email_after_normalization_returns_validation_error(self):
+        repository = UserRepository()
+        existing, _ = repository.insert("Alice", "alice@example.com")
+
+        user, error = repository.insert("Alicia", " ALICE@example.com ")
+
+        assert user is None
+        assert error.error_type == "validation_error"
+        assert error.message == "email is already registered"
+        assert error.context["provided_email"] == " ALICE@example.com "
+        assert error.context["normalized_email"] == "alice@example.com"
+        assert error.context["validation_step"] == "unique_check"
+        assert error.metadata["validation_rule"] == "unique_email"
+        assert error.metadata["existing_user_id"] == existing.id
+        assert repository.count() == 1
+
+    def test_rejected_insert_does_not_consume_an_id(self):
+        repository = create_sequential_repository()
+        repository.insert("Alice", "alice@example.com")
+        repository.insert("Alice", "alice@example.com")
+
+        user, _ = repository.insert("Bob", "bob@example.com")
+
+        assert user.id == 2
+
+
+class TestFindByEmail:
+    def test_finds_user_with_unnormalized_email(self):
+        repository = UserRepository()
+        created, _ = repository.insert("Alice", "alice@example.com")
+
+        user, error = repository.find_by_email(" ALICE@Example.com")
+
+        assert error is None
+        assert user == created
+
+    def test_missing_email_returns_not_found_error(self):
+        repository = create_repository("Alice")
+
+        user, error = repository.find_by_email("bob@example.com", "admin_search")
+
+        assert user is None
+        assert error.error_type == "not_found_error"
+        assert error.context["search_context"] == "admin_search"
+        assert error.context["normalized_email"] == "bob@example.com"
+        assert error.metadata["stored_user_count"] == 1
+
+
+class TestSearchByNamePrefix:
+    def test_returns_matches_ordered_by_casefolded_name(self):
+        repository = create_repository("bob", "Alice", "alan", "ALBERT", "Carol")
+
+        users, error = repository.search_by_name_prefix("AL")
+
+        assert error is None
+        assert [user.name for user in users] == ["alan", "ALBERT", "Alice"]
+
+    def test_respects_limit(self):
+        repository = create_repository("alan", "Albert", "alice")
+
+        users, error = repository.search_by_name_prefix("al", limit=2)
+
+        assert error is None
+        assert [user.name for user in users] == ["alan", "Albert"]
+
+    def test_no_match_returns_empty_list(self):
+        users, error = create_repository("Alice").search_by_name_prefix("z")
+
+        assert error is None
+        assert users == []
+
+    def test_sees_inserts_across_merged_runs(self):
+        names = [f"user{index:05d}" for index in range(NAME_TAIL_RUN_SIZE * 5 + 3)]
+        repository = create_repository(*reversed(names))
+
+        users, error = repository.search_by_name_prefix("USER001", limit=5)
+
+        assert error is None
+        assert [user.name for user in users] == names[100:105]
+
+    def test_non_positive_limit_returns_validation_error(self):
+        users, error = create_repository("Alice").search_by_name_prefix("a", limit=0)
+
+        assert users is None
+        assert error.error_type == "validation_error"
+        assert error.context["provided_limit"] == 0
+
+
+class TestNormalizeEmail:
+    def test_strips_and_lowercases(self):
+        assert normalize_email("  Alice@Example.COM ") == "alice@example.com"
+
+
+class TestMeasureUserMemory:
+    def test_reports_per_user_bytes(self):
+        report, error = measure_user_memory(1000)
+
+        assert error is None
+        assert report.user_count == 1000
+        assert report.repository_bytes > 0
+        assert report.dataclass_bytes > 0
+        assert report.repository_bytes_per_user == report.repository_bytes / 1000
+
+    def test_non_positive_count_returns_validation_error(self):
+        report, error = measure_user_memory(0)
+
+        assert report is None
+        assert error.error_type == "validation_error"
+        assert error.context["provided_user_count"] == 0
@@ -0,0 +1 @@
+"""Unit tests for the utility modules (src/utils)."""
@@ -0,0 +1,82 @@
+"""Unit tests for src/utils/datetime_utils.py."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.types.result_types import PygonError
+from src.utils import datetime_utils
+from src.utils.datetime_utils import (
+    DEFAULT_CLOCK_RESOLUTION_SECONDS,
+    CoarseClock,
+    coarse_clock,
+    configure_coarse_clock,
+)
+
+
+class TestCoarseClock:
+    def test_now_iso_is_close_to_wall_clock(self):
+        clock = CoarseClock(resolution_seconds=0.01)
+
+        cached = datetime.fromisoformat(clock.now_iso())
+
+        assert abs(datetime.now() - cached) < timedelta(seconds=1)
+        assert abs(time.time_ns() - clock.now_ns()) < 1_000_000_000
+
+    def test_value_refreshes_after_resolution(self):
+        clock = CoarseClock(resolution_seconds=0.01)
+        first = clock.now_ns()
+
+        time.sleep(0.1)
+
+        assert clock.now_ns() > first
+
+    def test_value_is_reused_within_resolution(self, monkeypatch):
+        clock = CoarseClock(resolution_seconds=0.01)
+        monotonic_ns = [1_000_000_000]
+        monkeypatch.setattr(datetime_utils.time, "monotonic_ns", lambda: monotonic_ns[0])
+        first = clock.now_iso()
+
+        monotonic_ns[0] += 9_000_000
+        time.sleep(0.02)
+        cached = clock.now_iso()
+        monotonic_ns[0] += 1_000_000
+        refreshed = clock.now_iso()
+
+        assert cached == first
+        assert refreshed != first
+
+    def test_reads_start_no_thread(self):
+        threads_before = threading.active_count()
+
+        CoarseClock(resolution_seconds=0.01).now_iso()
+
+        assert threading.active_count() == threads_before
+
+
+class TestConfigureCoarseClock:
+    def test_non_positive_resolution_returns_validation_error(self):
+        is_configured, error = configure_coarse_clock(0)
+
+        assert is_configured is False
+        assert error.error_type == "validation_error"
+        assert error.context["provided_value"] == 0
+
+    def test_positive_resolution_is_applied(self):
+        try:
+            is_configured, error = configure_coarse_clock(0.05)
+
+            assert is_configured is True
+            assert error is None
+            assert coarse_clock.resolution_seconds == 0.05
+        finally:
+            configure_coarse_clock(DEFAULT_CLOCK_RESOLUTION_SECONDS)
+
+
+class TestPygonErrorTimestamp:
+    def test_timestamp_parses_as_iso_format(self):
+        error = PygonError("validation_error", "bad")
+
+        timestamp = datetime.fromisoformat(error.timestamp)
+
+        assert abs(datetime.now() - timestamp) < timedelta(seconds=1)
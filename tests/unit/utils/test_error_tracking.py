@@ -0,0 +1,240 @@
+"""Unit tests for src/utils/error_tracking.py."""
+
+import gc
+import sys
+import threading
+
+import pytest
+
+from src.types.result_types import PygonError, create_io_error, create_validation_error
+from src.utils import error_tracking
+from src.utils.error_tracking import (
+    disable_error_tracking,
+    enable_error_tracking,
+    estimate_error_size,
+    get_error_tracking_snapshot,
+    reset_error_tracking,
+    start_error_tracking_reporter,
+)
+
+LARGE_LOCAL_ITEMS = 50_000
+# Above the locals of the pytest frames every measured f_back chain ends in
+LARGE_TRACEBACK_BYTES = 256 * 1024
+
+
+def _raise_with_large_locals() -> None:
+    payload = list(range(LARGE_LOCAL_ITEMS))
+    raise ValueError(f"boom with {len(payload)} items")
+
+
+def _capture_exception() -> ValueError:
+    try:
+        _raise_with_large_locals()
+    except ValueError as exception:
+        return exception
+    raise AssertionError("unreachable")
+
+
+def _create_error_in_callee() -> PygonError:
+    try:
+        int("not a number")
+    except ValueError as exception:
+        return create_io_error("parse failed", cause=exception)
+    raise AssertionError("unreachable")
+
+
+def _create_error_with_large_caller_locals() -> PygonError:
+    payload = list(range(LARGE_LOCAL_ITEMS))
+    assert len(payload) == LARGE_LOCAL_ITEMS
+    return _create_error_in_callee()
+
+
+def _stack_depth() -> int:
+    """Number of frames from the caller of this function up to the thread's entry point."""
+    depth = 0
+    frame = sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def _create_cyclic_error() -> None:
+    """Create and drop an error that is only collectable by the cyclic GC."""
+    try:
+        int("not a number")
+    except ValueError as exception:
+        error = create_io_error("parse failed", cause=exception)
+        # error -> cause -> __traceback__ -> this frame -> local `error`
+        assert error.cause is exception
+
+
+@pytest.fixture(autouse=True)
+def tracking():
+    reset_error_tracking()
+    enable_error_tracking(large_traceback_bytes=LARGE_TRACEBACK_BYTES)
+    yield
+    disable_error_tracking()
+    reset_error_tracking()
+
+
+def snapshot_for(error_type: str) -> list[error_tracking.ErrorProducerStats]:
+    return [stats for stats in get_error_tracking_snapshot(top_n=100) if stats.error_type == error_type]
+
+
+class TestEstimateErrorSize:
+    def test_error_without_cause_has_no_frames(self):
+        size, footprint = estimate_error_size(create_validation_error("bad", context={"field": "email"}))
+
+        assert size > 0
+        assert footprint.frame_count == 0
+        assert footprint.frame_bytes == 0
+
+    def test_cause_charges_traceback_frames_and_locals(self):
+        exception = _capture_exception()
+
+        size, footprint = estimate_error_size(create_io_error("failed", cause=exception))
+
+        assert footprint.frame_count == 2 + _stack_depth()
+        assert footprint.frame_bytes > LARGE_LOCAL_ITEMS * 8
+        assert size > footprint.frame_bytes
+
+    def test_returned_callers_are_charged_through_f_back(self):
+        error = _create_error_with_large_caller_locals()
+        gc.collect()
+
+        _, footprint = estimate_error_size(error)
+
+        # _create_error_in_callee, _create_error_with_large_caller_locals and this test's stack
+        assert footprint.frame_count == 2 + _stack_depth()
+        assert footprint.frame_bytes > LARGE_LOCAL_ITEMS * 8
+
+    def test_module_globals_are_not_charged(self):
+        namespace = {"CACHE": {index: str(index) for index in range(LARGE_LOCAL_ITEMS)}}
+        source = "try:\n    int('x')\nexcept ValueError as exception:\n    caught = exception\n"
+        exec(source, namespace)  # noqa: S102 - runs the producer as a module-level frame
+
+        _, footprint = estimate_error_size(create_io_error("failed", cause=namespace["caught"]))
+
+        assert footprint.frame_count == 1 + _stack_depth()
+        assert footprint.frame_bytes < LARGE_TRACEBACK_BYTES
+
+
+class TestTracking:
+    def test_errors_are_attributed_to_their_producer(self):
+        errors = [create_validation_error("bad") for _ in range(3)]
+
+        stats = snapshot_for("validation_error")
+
+        assert len(stats) == 1
+        assert stats[0].source_location.startswith(__file__)
+        assert stats[0].live_count == 3
+        assert stats[0].created_count == 3
+        assert len(errors) == 3
+
+    def test_large_traceback_is_flagged(self):
+        error = create_io_error("failed", cause=_capture_exception())
+
+        stats = snapshot_for("io_error")
+
+        assert stats[0].large_traceback_count == 1
+        assert error.cause is not None
+
+    def test_large_locals_of_returned_callers_are_flagged(self):
+        error = _create_error_with_large_caller_locals()
+        gc.collect()
+
+        stats = snapshot_for("io_error")
+
+        assert stats[0].large_traceback_count == 1
+        assert stats[0].retained_bytes > LARGE_LOCAL_ITEMS * 8
+        assert error.cause is not None
+
+    def test_small_traceback_is_not_flagged(self):
+        try:
+            int("x")
+        except ValueError as exception:
+            error = create_io_error("failed", cause=exception)
+
+        assert snapshot_for("io_error")[0].large_traceback_count == 0
+        assert error.cause is not None
+
+    def test_live_count_drops_after_collection(self):
+        error = create_io_error("failed", cause=_capture_exception())
+        assert snapshot_for("io_error")[0].live_count == 1
+
+        del error
+        gc.collect()
+
+        stats = snapshot_for("io_error")[0]
+        assert stats.live_count == 0
+        assert stats.retained_bytes == 0
+        assert stats.large_traceback_count == 0
+        assert stats.created_count == 1
+
+    def test_cyclic_errors_are_released_by_gc(self):
+        for _ in range(10):
+            _create_cyclic_error()
+
+        gc.collect()
+
+        assert snapshot_for("io_error")[0].live_count == 0
+
+    def test_gc_pass_while_lock_is_held_does_not_deadlock(self):
+        _create_cyclic_error()
+
+        def collect_while_locked() -> None:
+            with error_tracking._lock:
+                gc.collect()
+
+        worker = threading.Thread(target=collect_while_locked, daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+
+        assert not worker.is_alive()
+        assert snapshot_for("io_error")[0].live_count == 0
+
+    def test_disabled_tracking_ignores_new_errors(self):
+        disable_error_tracking()
+
+        PygonError("custom_error", "ignored")
+
+        assert snapshot_for("custom_error") == []
+
+    def test_reset_ignores_releases_of_earlier_errors(self):
+        errors = []
+        for round_index in range(2):
+            if round_index == 1:
+                reset_error_tracking()
+            errors.append(create_validation_error("bad"))
+
+        del errors[0]
+        gc.collect()
+
+        stats = snapshot_for("validation_error")[0]
+        assert stats.live_count == 1
+        assert stats.created_count == 1
+
+
+class TestReporter:
+    def test_non_positive_interval_returns_validation_error(self):
+        stop_event, error = start_error_tracking_reporter(0)
+
+        assert stop_event is None
+        assert error.error_type == "validation_error"
+
+    def test_reports_are_sent_to_sink(self):
+        reports: list[str] = []
+        reported = threading.Event()
+
+        def sink(report: str) -> None:
+            reports.append(report)
+            reported.set()
+
+        create_validation_error("bad")
+        stop_event, error = start_error_tracking_reporter(0.01, top_n=1, sink=sink)
+
+        assert error is None
+        assert reported.wait(timeout=5)
+        stop_event.set()
+        assert "validation_error" in reports[0]
@@ -0,0 +1,124 @@
+"""Unit tests for src/utils/id_generator.py."""
+
+import itertools
+import multiprocessing
+
+import pytest
+
+from src.utils import id_generator
+from src.utils.id_generator import (
+    ID_EPOCH_MS,
+    MAX_SEQUENCE,
+    MAX_WORKER_ID,
+    IdGenerator,
+    assign_worker_id_from_counter,
+    configure_id_worker,
+    decompose_id,
+    init_pool_worker_id,
+    next_id,
+)
+
+FIXED_MS = ID_EPOCH_MS + 1_000_000
+
+
+def fake_clock(monkeypatch: pytest.MonkeyPatch, *milliseconds: int) -> None:
+    """Make time.time_ns return the given milliseconds in order, then repeat the last one."""
+    values = list(milliseconds)
+
+    def time_ns() -> int:
+        current = values.pop(0) if len(values) > 1 else values[0]
+        return current * 1_000_000
+
+    monkeypatch.setattr(id_generator.time, "time_ns", time_ns)
+
+
+@pytest.fixture(autouse=True)
+def restore_default_generator(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(id_generator, "_default_generator", id_generator._default_generator)
+
+
+class TestIdGenerator:
+    def test_decompose_id_round_trips(self, monkeypatch):
+        fake_clock(monkeypatch, FIXED_MS)
+        generator = IdGenerator(7)
+
+        generator.next_id()
+        fields = decompose_id(generator.next_id())
+
+        assert fields == {"timestamp_ms": FIXED_MS, "worker_id": 7, "sequence": 1}
+
+    def test_sequence_overflow_borrows_next_millisecond(self, monkeypatch):
+        fake_clock(monkeypatch, FIXED_MS)
+        generator = IdGenerator(1)
+
+        ids = [generator.next_id() for _ in range(MAX_SEQUENCE + 2)]
+
+        assert all(earlier < later for earlier, later in itertools.pairwise(ids))
+        assert decompose_id(ids[MAX_SEQUENCE]) == {
+            "timestamp_ms": FIXED_MS, "worker_id": 1, "sequence": MAX_SEQUENCE
+        }
+        assert decompose_id(ids[-1]) == {"timestamp_ms": FIXED_MS + 1, "worker_id": 1, "sequence": 0}
+
+    def test_clock_going_backwards_keeps_ids_increasing(self, monkeypatch):
+        fake_clock(monkeypatch, FIXED_MS, FIXED_MS - 5, FIXED_MS - 10, FIXED_MS + 1)
+        generator = IdGenerator(1)
+
+        ids = [generator.next_id() for _ in range(4)]
+
+        assert all(earlier < later for earlier, later in itertools.pairwise(ids))
+        assert [decompose_id(generated)["timestamp_ms"] for generated in ids] == [
+            FIXED_MS, FIXED_MS, FIXED_MS, FIXED_MS + 1
+        ]
+
+    def test_different_workers_never_collide(self, monkeypatch):
+        fake_clock(monkeypatch, FIXED_MS)
+        first, second = IdGenerator(1), IdGenerator(2)
+
+        first_ids = {first.next_id() for _ in range(100)}
+        second_ids = {second.next_id() for _ in range(100)}
+
+        assert first_ids.isdisjoint(second_ids)
+
+
+class TestConfigureIdWorker:
+    @pytest.mark.parametrize("worker_id", [-1, MAX_WORKER_ID + 1])
+    def test_out_of_range_worker_id_returns_validation_error(self, worker_id):
+        is_configured, error = configure_id_worker(worker_id)
+
+        assert is_configured is False
+        assert error.error_type == "validation_error"
+        assert error.context["provided_value"] == worker_id
+
+    def test_configured_worker_id_is_used_by_next_id(self):
+        is_configured, error = configure_id_worker(MAX_WORKER_ID)
+
+        assert is_configured is True
+        assert error is None
+        assert decompose_id(next_id())["worker_id"] == MAX_WORKER_ID
+
+
+class TestPoolWorkerIds:
+    def test_counter_assigns_consecutive_worker_ids(self):
+        counter = multiprocessing.Value("i", 3)
+
+        is_assigned, error = assign_worker_id_from_counter(counter)
+
+        assert is_assigned is True
+        assert error is None
+        assert counter.value == 4
+        assert decompose_id(next_id())["worker_id"] == 3
+
+    def test_exhausted_counter_returns_validation_error(self):
+        counter = multiprocessing.Value("i", MAX_WORKER_ID + 1)
+
+        is_assigned, error = assign_worker_id_from_counter(counter)
+
+        assert is_assigned is False
+        assert error.error_type == "validation_error"
+        assert "exhausted" in error.message
+
+    def test_pool_initializer_raises_when_exhausted(self):
+        counter = multiprocessing.Value("i", MAX_WORKER_ID + 1)
+
+        with pytest.raises(RuntimeError, match="worker ids exhausted"):
+            init_pool_worker_id(counter)